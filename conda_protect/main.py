@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import NamedTuple
 from collections.abc import Sequence
 
 import click
@@ -12,9 +14,10 @@ from conda.base.constants import ROOT_ENV_NAME
 from conda.core.envs_manager import list_all_known_prefixes
 from conda.exceptions import CondaError
 from conda.plugins import hookimpl, CondaPreCommand, CondaSubcommand
-from rich import print as r_print
-from rich.console import Console
-from rich.table import Table
+
+# NOTE: `rich` is deliberately only imported inside the functions that render
+# output. This module is imported by conda's plugin loader on every conda
+# command, and the import cost should not be paid unless something is shown.
 
 #: Name of the plugin; this will appear in certain outputs
 PLUGIN_NAME = "conda_protected"
@@ -41,42 +44,140 @@ class CondaProtectError(CondaError):
     """
 
 
-class EnvironmentInfo(NamedTuple):
-    name: str
-    path: Path
-    guarded: bool
+class EnvironmentInfo:
+    """
+    Lightweight record describing a single environment.
 
+    A plain ``__slots__`` class rather than a ``NamedTuple``
+    (``dataclass(slots=True)`` needs Python 3.10, which we cannot require
+    yet): instances carry no ``__dict__`` and attribute reads are
+    fixed-offset slot loads instead of going through the tuple machinery.
+    """
 
-def get_environment_info() -> list[EnvironmentInfo]:
+    __slots__ = ("name", "path", "guarded")
+
+    def __init__(self, name: str, path: Path, guarded: bool) -> None:
+        self.name = name
+        self.path = path
+        self.guarded = guarded
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(name={self.name!r}, path={self.path!r}, "
+            f"guarded={self.guarded!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, EnvironmentInfo):
+            return NotImplemented
+        return (
+            self.name == other.name
+            and self.path == other.path
+            and self.guarded == other.guarded
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.name, self.path, self.guarded))
+
+
+@lru_cache(maxsize=1)
+def _known_prefixes() -> tuple[str, ...]:
+    """
+    Caches `list_all_known_prefixes`, which scans all `envs_dirs` on disk,
+    so the discovery only runs once per process.
+    """
+    return tuple(list_all_known_prefixes())
+
+
+@lru_cache(maxsize=1)
+def _known_name_to_prefix() -> dict[str, str]:
+    """
+    Caches the name -> prefix mapping derived from `_known_prefixes`.
+    """
+    return get_name_to_prefix_map(_known_prefixes())
+
+
+@lru_cache(maxsize=1)
+def _known_prefix_to_name() -> dict[str, str]:
     """
-    Returns all environments currently known to conda.
+    Caches the prefix -> name mapping derived from `_known_prefixes`.
     """
-    prefixes = list_all_known_prefixes()
-    name_to_prefix = get_name_to_prefix_map(prefixes)
+    return get_prefix_to_name_map(_known_prefixes())
+
 
-    env_info = []
+def _refresh_known_environments() -> None:
+    """
+    Clears the cached environment discovery so it is recomputed on next use.
+    """
+    _known_prefixes.cache_clear()
+    _known_name_to_prefix.cache_clear()
+    _known_prefix_to_name.cache_clear()
+
+
+def _find_guarded_prefixes(prefixes: Sequence[str]) -> set[str]:
+    """
+    Returns the subset of ``prefixes`` that contain a guardfile.
+
+    Prefixes are grouped by parent directory and each parent is read once with
+    ``os.scandir``, so guardfiles are only probed for environments that still
+    exist on disk (e.g. stale ``environments.txt`` entries are skipped without
+    a ``stat()`` each). The remaining probes are independent ``stat()`` calls
+    that may each block on the filesystem (network-mounted environments in
+    particular), so they are fanned out to a small thread pool.
+    """
+    prefixes_by_parent: dict[str, list[str]] = {}
 
     for prefix in prefixes:
-        if prefix not in name_to_prefix.values():
-            path = Path(prefix)
-            guardfile = path.joinpath(GUARDFILE_NAME)
-            try:
-                env_info.append(
-                    EnvironmentInfo(name="", path=path, guarded=guardfile.exists())
-                )
-            except OSError as exc:
-                logger.warning(
-                    f"Could not determine if protect file '{guardfile}' exists: {exc}"
-                )
-
-    for name, prefix in name_to_prefix.items():
-        path = Path(prefix)
-        guardfile = path.joinpath(GUARDFILE_NAME)
-        env_info.append(
-            EnvironmentInfo(name=name, path=path, guarded=guardfile.exists())
+        prefixes_by_parent.setdefault(os.path.dirname(prefix), []).append(prefix)
+
+    candidates = []
+
+    for parent, children in prefixes_by_parent.items():
+        try:
+            with os.scandir(parent) as entries:
+                existing = {entry.name for entry in entries}
+        except OSError as exc:
+            logger.warning(f"Could not read environment directory '{parent}': {exc}")
+            continue
+
+        candidates.extend(
+            prefix for prefix in children if os.path.basename(prefix) in existing
         )
 
-    return sorted(env_info, key=lambda env: env.name)
+    def probe(prefix: str) -> bool:
+        return os.path.lexists(os.path.join(prefix, GUARDFILE_NAME))
+
+    if len(candidates) <= 1:
+        return {prefix for prefix in candidates if probe(prefix)}
+
+    with ThreadPoolExecutor(max_workers=min(32, len(candidates))) as executor:
+        return {
+            prefix
+            for prefix, guarded in zip(candidates, executor.map(probe, candidates))
+            if guarded
+        }
+
+
+def get_environment_info() -> list[EnvironmentInfo]:
+    """
+    Returns all environments currently known to conda, in no particular
+    order; callers that display the list sort it after filtering.
+    """
+    prefix_to_name = _known_prefix_to_name()
+
+    # The root prefix enters via the map rather than the prefix listing, so
+    # take the de-duplicated union of the two before probing guardfiles.
+    all_prefixes = list(dict.fromkeys((*_known_prefixes(), *prefix_to_name)))
+    guarded_prefixes = _find_guarded_prefixes(all_prefixes)
+
+    return [
+        EnvironmentInfo(
+            name=prefix_to_name.get(prefix, ""),
+            path=Path(prefix),
+            guarded=prefix in guarded_prefixes,
+        )
+        for prefix in all_prefixes
+    ]
 
 
 def toggle_environment_guard(env: EnvironmentInfo) -> EnvironmentInfo:
@@ -100,33 +201,46 @@ def toggle_environment_guard(env: EnvironmentInfo) -> EnvironmentInfo:
     return EnvironmentInfo(name=env.name, path=env.path, guarded=not env.guarded)
 
 
-def get_name_to_prefix_map(prefixes: list[str]) -> dict[str, str]:
+def toggle_guard(prefix: str | Path) -> bool:
+    """
+    Toggles the guard on an environment prefix directly, returning `True`
+    when the environment ends up guarded. Thin wrapper around
+    `toggle_environment_guard` for callers that only have a prefix.
+    """
+    env = _make_env_info(name="", prefix=str(prefix))
+
+    return toggle_environment_guard(env).guarded
+
+
+def get_name_to_prefix_map(prefixes: Sequence[str]) -> dict[str, str]:
     """
     Retrieves a mapping name -> prefix
 
     TODO: What if there's duplicate names in multiple `envs_dirs`? 🤷‍
           Let's just pretend that never happens 🤫
     """
+    sep = os.sep
+    envs_dirs = tuple(context.envs_dirs)
     mapping = {
-        os.path.basename(prefix): prefix
+        prefix.rpartition(sep)[2]: prefix
         for prefix in prefixes
-        for env_dir in context.envs_dirs
-        if prefix.startswith(env_dir)
+        if prefix.startswith(envs_dirs)
     }
     mapping[ROOT_ENV_NAME] = context.root_prefix
 
     return mapping
 
 
-def get_prefix_to_name_map(prefixes: list[str]) -> dict[str, str]:
+def get_prefix_to_name_map(prefixes: Sequence[str]) -> dict[str, str]:
     """
     Retrieves a mapping of prefix -> name
     """
+    sep = os.sep
+    envs_dirs = tuple(context.envs_dirs)
     mapping = {
-        prefix: os.path.basename(prefix)
+        prefix: prefix.rpartition(sep)[2]
         for prefix in prefixes
-        for env_dir in context.envs_dirs
-        if prefix.startswith(env_dir)
+        if prefix.startswith(envs_dirs)
     }
     mapping[context.root_prefix] = ROOT_ENV_NAME
 
@@ -137,6 +251,9 @@ def display_environment_info_table(environments: Sequence[EnvironmentInfo]) -> N
     """
     Displays a rich table
     """
+    from rich.console import Console
+    from rich.table import Table
+
     table = Table(title="Conda Environments")
 
     table.add_column("Name", style="cyan")
@@ -154,29 +271,41 @@ def display_environment_info_table(environments: Sequence[EnvironmentInfo]) -> N
     console.print(table)
 
 
+def _make_env_info(name: str, prefix: str) -> EnvironmentInfo:
+    """
+    Builds an `EnvironmentInfo` for a prefix, probing its guardfile once.
+    """
+    return EnvironmentInfo(
+        name=name,
+        path=Path(prefix),
+        guarded=os.path.lexists(os.path.join(prefix, GUARDFILE_NAME)),
+    )
+
+
 def validate_environment(ctx, param, value) -> EnvironmentInfo | None:
     """
     Makes sure that the environment passed in actually exists
     """
-    # Construct two lists with known prefixes and environment names
-    prefixes = list_all_known_prefixes()
-    name_to_prefix = get_name_to_prefix_map(prefixes)
+    if value is None:
+        return None
+
+    prefixes = _known_prefixes()
+    name_to_prefix = _known_name_to_prefix()
+
+    if value not in prefixes and value not in name_to_prefix:
+        # The environment may have been created after the cache was primed
+        # (e.g. earlier in the same process); refresh once before giving up.
+        _refresh_known_environments()
+        prefixes = _known_prefixes()
+        name_to_prefix = _known_name_to_prefix()
+
+    if value in name_to_prefix:
+        return _make_env_info(name=value, prefix=name_to_prefix[value])
 
     if value not in prefixes:
-        if value is not None:
-            if value not in name_to_prefix.keys():
-                raise CondaProtectError("Environment not found")
-            path = Path(name_to_prefix[value])
-            return EnvironmentInfo(
-                name=value, path=path, guarded=path.joinpath(GUARDFILE_NAME).exists()
-            )
-        else:
-            return
+        raise CondaProtectError("Environment not found")
 
-    path = Path(value)
-    return EnvironmentInfo(
-        name=value, path=path, guarded=path.joinpath(GUARDFILE_NAME).exists()
-    )
+    return _make_env_info(name=value, prefix=value)
 
 
 @click.command(GUARD_COMMAND_NAME)
@@ -206,9 +335,13 @@ def guard(environment, list_envs, protected, named):
         if named:
             all_environments = [env for env in all_environments if env.name]
 
+        all_environments.sort(key=attrgetter("name"))
+
         display_environment_info_table(all_environments)
 
     else:
+        from rich import print as r_print
+
         env = toggle_environment_guard(environment)
         guarded_or_unguarded = "[green]protected" if env.guarded else "[magenta]unprotected"
         r_print(
@@ -240,13 +373,21 @@ def _get_active_environment() -> tuple[str, str | Path] | tuple[None, None]:
     if not arg_data:
         return None, None
 
+    # `_raw_value` is present on conda's parameter wrappers in practice, so a
+    # try/except around the direct access beats `getattr` with a default.
     if name_option := arg_data.get("name"):
-        if name := getattr(name_option, "_raw_value", None):
-            return "name", name
+        try:
+            if name := name_option._raw_value:
+                return "name", name
+        except AttributeError:
+            pass
 
     if prefix_option := arg_data.get("prefix"):
-        if prefix := getattr(prefix_option, "_raw_value", None):
-            return "path", Path(prefix)
+        try:
+            if prefix := prefix_option._raw_value:
+                return "path", Path(prefix)
+        except AttributeError:
+            pass
 
     return None, None
 
@@ -263,24 +404,38 @@ def conda_guard_pre_commands_action(command: str):
     if context.dry_run:
         return
 
-    known_envs = get_environment_info()
     lookup_attr, value = _get_active_environment()
+    name = value if lookup_attr == "name" else ""
 
-    if lookup_attr is None or value is None:
-        lookup_attr = "path"
-        value = Path(context.target_prefix)
+    # conda has already resolved `-n`/`-p` into `context.target_prefix`, so
+    # when it is set the probe needs no environment discovery at all. Only
+    # fall back to resolving the name/prefix ourselves when it is not.
+    prefix = context.target_prefix
 
-    # Create a list of guarded environments; length should be zero or one
-    guarded_envs = [
-        env for env in known_envs if getattr(env, lookup_attr) == value and env.guarded
-    ]
+    if not prefix:
+        if lookup_attr == "name":
+            prefix = _known_name_to_prefix().get(value)
+        elif value is not None:
+            prefix = str(value)
 
-    if guarded_envs:
-        env = guarded_envs[0]
-        raise CondaProtectError(
-            f'Environment "{env.name or env.path}" is currently protected. '
-            f"Run `conda {GUARD_COMMAND_NAME} '{env.name or env.path}'` to remove protection."
-        )
+        if not prefix:
+            return
+
+    # Probe the candidate first; in the common (unguarded) case there is
+    # nothing else to compute.
+    if not os.path.lexists(os.path.join(prefix, GUARDFILE_NAME)):
+        return
+
+    # The environment is guarded, so it is worth resolving a friendly name
+    # for the error message now.
+    if not name:
+        name = _known_prefix_to_name().get(prefix, "")
+
+    display = name or prefix
+    raise CondaProtectError(
+        f'Environment "{display}" is currently protected. '
+        f"Run `conda {GUARD_COMMAND_NAME} '{display}'` to remove protection."
+    )
 
 
 @hookimpl
@@ -0,0 +1,67 @@
+"""
+Shared configuration for the test suite.
+
+Creating conda environments is IO-bound (package payloads are linked or
+copied into the new prefix), so when RAM-backed storage is available both
+conda's package cache and pytest's temporary directories are pointed at it.
+"""
+import getpass
+import os
+import shutil
+import tempfile
+
+import pytest
+
+#: RAM-backed directory used for conda/pytest scratch space when writable
+TMPFS_DIR = "/dev/shm"
+
+
+def _tmpfs_usable() -> bool:
+    return os.path.isdir(TMPFS_DIR) and os.access(TMPFS_DIR, os.W_OK)
+
+
+try:
+    import xdist  # noqa: F401
+except ImportError:
+    # pytest-xdist is optional; without it, provide the worker_id the plugin
+    # would report for a non-distributed run so fixtures can still key on it.
+    @pytest.fixture(scope="session")
+    def worker_id() -> str:
+        return "master"
+
+
+def pytest_configure(config):
+    # Base pytest's tmp directories (and with them the test environments) on
+    # tmpfs, unless the user picked a --basetemp themselves.
+    if _tmpfs_usable() and config.option.basetemp is None:
+        config.option.basetemp = os.path.join(TMPFS_DIR, f"pytest-{getpass.getuser()}")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def tmpfs_package_cache():
+    """
+    Prepends a tmpfs directory to conda's pkgs_dirs so package writes and
+    extractions during the session happen in RAM. Existing caches stay
+    readable because they remain on the search path. No-op when tmpfs is
+    not usable (non-Linux platforms, locked-down CI images, ...).
+    """
+    if not _tmpfs_usable():
+        yield
+        return
+
+    from conda.base.context import context, reset_context
+
+    pkgs_dir = tempfile.mkdtemp(prefix="conda-pkgs-", dir=TMPFS_DIR)
+    original = os.environ.get("CONDA_PKGS_DIRS")
+    os.environ["CONDA_PKGS_DIRS"] = ",".join((pkgs_dir, *context.pkgs_dirs))
+    reset_context()
+
+    try:
+        yield
+    finally:
+        if original is None:
+            os.environ.pop("CONDA_PKGS_DIRS", None)
+        else:
+            os.environ["CONDA_PKGS_DIRS"] = original
+        reset_context()
+        shutil.rmtree(pkgs_dir, ignore_errors=True)
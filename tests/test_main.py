@@ -2,83 +2,131 @@
 These are mostly just integration tests that make sure this plugin
 works at a high level.
 """
+import os
+import shutil
+
 import pytest
-from conda.testing import conda_cli  # noqa: F401
+from conda.testing.fixtures import conda_cli, session_conda_cli  # noqa: F401
 from conda.exceptions import DryRunExit
 
-from conda_protect.main import GUARDFILE_NAME, CondaProtectError, GUARD_COMMAND_NAME
+from conda_protect.main import (
+    GUARDFILE_NAME,
+    CondaProtectError,
+    GUARD_COMMAND_NAME,
+    toggle_guard,
+)
 
 
-@pytest.fixture()
-def conda_environment(conda_cli, tmp_path):  # noqa: F811
-    environment = tmp_path.joinpath("tmp_env")
+@pytest.fixture(scope="session")
+def conda_environment(session_conda_cli, tmp_path_factory, worker_id):  # noqa: F811
+    """
+    A conda environment shared by the whole test session. Creating (and
+    removing) an environment is by far the most expensive part of these
+    tests, so it is only done once; each test removes any guardfile it
+    created so the next test starts from an unguarded state.
+
+    When pytest-xdist is installed and the run is distributed, every worker
+    runs its own session, so the prefix is keyed off ``worker_id``
+    (``"master"`` for non-distributed runs) to keep workers from colliding
+    on the same environment.
+    """
+    environment = tmp_path_factory.mktemp("envs").joinpath(f"tmp_env_{worker_id}")
 
-    out, err, code = conda_cli(
-        "create", "--yes", "--quiet", "--prefix", str(environment)
+    # `--offline` skips the solver/repodata fetch entirely; these tests only
+    # need a valid prefix, not any installed packages.
+    out, err, code = session_conda_cli(
+        "create", "--yes", "--quiet", "--offline", "--prefix", str(environment)
     )
 
-    assert err == ""
+    # session_conda_cli runs without captured streams, so err may be None
+    assert not err
 
     yield environment
 
-    # remove environment
-    out, err, code = conda_cli("env", "remove", "--yes", "--prefix", str(environment))
-    assert err == ""
+    # CI runners are ephemeral, so their filesystem is discarded moments
+    # after the job finishes anyway
+    if os.environ.get("CI"):
+        return
+
+    # remove environment; it is a throwaway prefix under pytest's tmp dirs,
+    # so plain rmtree beats a full `conda env remove` bootstrap
+    shutil.rmtree(environment, ignore_errors=True)
 
 
-def test_guard_file_created(mocker, conda_cli, conda_environment):  # noqa: F811
+@pytest.fixture()
+def guarded_argv(mocker, conda_environment):
     """
-    When an environment is guarded, a conda_protect file will be written to its root.
+    Patches `sys.argv` the way a real `conda protect <env>` invocation looks
+    and hands back the environment it points at, so tests don't repeat the
+    patching boilerplate.
     """
     mocker.patch("sys.argv", ["conda", GUARD_COMMAND_NAME, str(conda_environment)])
 
-    out, err, code = conda_cli(GUARD_COMMAND_NAME, str(conda_environment))
-
-    assert err == ""
-    assert conda_environment.joinpath(GUARDFILE_NAME).is_file()
-
-    # remove conda_protect
-    out, err, code = conda_cli(GUARD_COMMAND_NAME, str(conda_environment))
-
-    assert err == ""
+    return conda_environment
 
 
-def test_guarded_command_fails(mocker, conda_cli, conda_environment):  # noqa: F811
+@pytest.mark.integration
+def test_guard_behaviours(conda_cli, guarded_argv):  # noqa: F811
     """
-    When an environment is guarded, running a modifying command on it should fail.
+    Exercises the whole guard lifecycle against a single environment:
+    guarding writes the guardfile, modifying commands fail while the guard
+    is in place, `--dry-run` is still allowed through, and unguarding
+    removes the guardfile again.
     """
-    mocker.patch("sys.argv", ["conda", GUARD_COMMAND_NAME, str(conda_environment)])
+    conda_environment = guarded_argv
 
-    out, err, code = conda_cli(GUARD_COMMAND_NAME, str(conda_environment))
+    try:
+        # guarding creates the guardfile
+        out, err, code = conda_cli(GUARD_COMMAND_NAME, str(conda_environment))
 
-    assert err == ""
+        assert err == ""
+        assert conda_environment.joinpath(GUARDFILE_NAME).is_file()
 
-    with pytest.raises(CondaProtectError):
-        conda_cli("install", "--prefix", str(conda_environment), "ca-certificates")
+        # modifying commands fail while guarded (before touching the prefix)
+        with pytest.raises(CondaProtectError):
+            conda_cli("install", "--prefix", str(conda_environment), "ca-certificates")
 
-    # remove conda_protect
-    out, err, code = conda_cli(GUARD_COMMAND_NAME, str(conda_environment))
+        # ...but a dry run continues past the guard; DryRunExit is only
+        # raised after a successful solve, so this install must be solvable
+        with pytest.raises(DryRunExit):
+            conda_cli(
+                "install",
+                "--dry-run",
+                "--prefix",
+                str(conda_environment),
+                "ca-certificates",
+            )
 
-    assert err == ""
+        # guarding again removes the guardfile
+        out, err, code = conda_cli(GUARD_COMMAND_NAME, str(conda_environment))
 
+        assert err == ""
+        assert not conda_environment.joinpath(GUARDFILE_NAME).exists()
+    finally:
+        conda_environment.joinpath(GUARDFILE_NAME).unlink(missing_ok=True)
 
-def test_dry_run_continues(mocker, conda_cli, conda_environment):
+
+def test_guardfile_roundtrip_unit(tmp_path):
     """
-    When `--dry-run` is used, the environment is not guarded
+    The guard toggle writes and removes the guardfile without going through
+    the conda CLI at all.
     """
-    mocker.patch("sys.argv", ["conda", GUARD_COMMAND_NAME, str(conda_environment)])
+    prefix = tmp_path.joinpath("unit_env")
+    prefix.joinpath("conda-meta").mkdir(parents=True)
 
-    out, err, code = conda_cli(GUARD_COMMAND_NAME, str(conda_environment))
+    assert toggle_guard(prefix) is True
+    assert prefix.joinpath(GUARDFILE_NAME).is_file()
 
-    assert err == ""
+    assert toggle_guard(prefix) is False
+    assert not prefix.joinpath(GUARDFILE_NAME).exists()
 
-    with pytest.raises(DryRunExit):
-        conda_cli("install", "--dry-run", "--prefix", str(conda_environment), "ca-certificates")
 
-    # remove conda_protect
-    out, err, code = conda_cli(GUARD_COMMAND_NAME, str(conda_environment))
-
-    assert err == ""
+def test_toggle_guard_failure_unit(tmp_path):
+    """
+    Failing to write the guardfile surfaces as a CondaProtectError.
+    """
+    with pytest.raises(CondaProtectError):
+        toggle_guard(tmp_path.joinpath("does_not_exist"))
 
 
 def test_ensure_help_works(conda_cli):